@@ -0,0 +1,25 @@
+"""Optional build script for the hot table formatters.
+
+Compiling format_tables with Cython gives the nested dict walks and
+string interpolation a C-level speedup for users who format large vault
+or position listings. The compiled extension shadows format_tables.py on
+import; without it the pure-Python module is used, so this step is
+entirely optional:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize('format_tables.py', language_level=3)
+
+setup(
+    name='vaultsfyi-examples',
+    ext_modules=ext_modules,
+)
@@ -9,177 +9,130 @@ This example demonstrates how to use the vaults.fyi Python SDK to:
 3. View user positions and balances
 """
 
+import asyncio
 import os
 import sys
+from functools import cache, partial
 from typing import Dict, Any, List, Optional
-from tabulate import tabulate
 
 from vaultsfyi import VaultsSdk
 
+from format_tables import (
+    format_deposit_options,
+    format_positions,
+    format_user_balances,
+)
+
+try:
+    import orjson
+except ImportError:  # optional speedup; requests falls back to stdlib json
+    orjson = None
+
 
 # Example address
 USER_ADDRESS = '0xdB79e7E9e1412457528e40db9fCDBe69f558777d'
 
 
-def format_transaction_blob(transaction: Dict[str, Any]) -> str:
-    """Format transaction data into a readable table."""
-    if not transaction or not isinstance(transaction, dict):
-        return 'No transaction data available'
-    
-    def truncate_value(key: str, value: str, max_length: int = 50) -> str:
-        """Truncate long values for better table formatting."""
-        if key == 'data' and len(value) > 20:
-            return value[:20] + '...'
-        elif len(value) > max_length:
-            return value[:max_length] + '...'
-        return value
-    
-    # Create table data for all transaction properties
-    table_data = []
-    
-    # Add basic transaction properties
+@cache
+def _tabulate():
+    """Import tabulate on first table render rather than at module import.
+
+    Only the transaction blob still renders through tabulate, so callers
+    using this module programmatically skip loading it entirely.
+    """
+    from tabulate import tabulate
+    return tabulate
+
+
+def _orjson_response_hook(response, **kwargs):
+    """Swap a response's stdlib JSON decoding for orjson."""
+    response.json = lambda **kw: orjson.loads(response.content)
+    return response
+
+
+def make_client(api_key: str) -> VaultsSdk:
+    """Build a VaultsSdk client backed by a single pooled HTTP session.
+
+    The SDK keeps one requests.Session per client, so every helper in this
+    example reuses the same keep-alive connections instead of paying the
+    DNS + TLS handshake on each call.
+    """
+    client = VaultsSdk(api_key=api_key)
+    if orjson is not None:
+        # Large depositOptions/positions payloads decode several times
+        # faster through orjson's C parser than through stdlib json.
+        client.session.hooks['response'].append(_orjson_response_hook)
+    return client
+
+
+def _s(value: Any) -> str:
+    """Coerce to str, skipping the no-op conversion for actual strings.
+
+    Most transaction fields already arrive as strings; str() on a str
+    still pays a C-level call, so dodge it with one type check.
+    """
+    return value if type(value) is str else str(value)
+
+
+def _truncate(value: str, max_length: int = 50) -> str:
+    """Truncate long values for better table formatting."""
+    if len(value) > max_length:
+        return value[:max_length] + '...'
+    return value
+
+
+# Calldata gets a tighter limit than the other columns; picking the
+# variant once per row beats re-checking the key inside _truncate.
+_truncate_data = partial(_truncate, max_length=20)
+
+
+def _basic_rows(transaction: Dict[str, Any]):
+    """Yield [key, value] rows for the flat transaction properties."""
     for key, value in transaction.items():
         if key == 'actions':
-            continue  # Handle separately
+            continue  # Expanded by _action_rows
         elif value is None or value == "":
-            table_data.append([key, 'N/A'])
+            yield [key, 'N/A']
         else:
-            formatted_value = truncate_value(key, str(value))
-            table_data.append([key, formatted_value])
-    
-    # Handle actions array
-    if 'actions' in transaction and isinstance(transaction['actions'], list):
-        table_data.append(['', ''])  # Empty row for spacing
-        table_data.append(['Total Actions', str(len(transaction['actions']))])
-        table_data.append(['', ''])  # Empty row for spacing
-        
-        for i, action in enumerate(transaction['actions']):
-            if isinstance(action, dict):
-                # Action header
-                action_name = action.get('name', f'Action {i+1}')
-                truncated_name = truncate_value('name', action_name, 60)
-                table_data.append([f'Action {i+1}', truncated_name])
-                
-                # Transaction details
-                tx_details = action.get('tx', {})
-                for tx_key, tx_value in tx_details.items():
-                    formatted_value = truncate_value(tx_key, str(tx_value))
-                    table_data.append([f'  {tx_key}', formatted_value])
-                
-                # Add spacing between actions
-                if i < len(transaction['actions']) - 1:
-                    table_data.append(['', ''])
-            else:
-                truncated_action = truncate_value('action', str(action))
-                table_data.append([f'Action {i+1}', truncated_action])
-    
-    return f"\n🎯 Generated Transaction Blob:\n{tabulate(table_data, headers=['Property', 'Value'], tablefmt='grid', maxcolwidths=[20, 60])}"
-
-
-def format_deposit_options(deposit_options_response: Dict[str, Any]) -> str:
-    """Format deposit options into a readable table."""
-    if not deposit_options_response or not deposit_options_response.get('userBalances'):
-        return 'No deposit options available'
-    
-    table_data = []
-    headers = ['Asset', 'Balance USD', 'Network', 'Vault Name', 'Protocol', 'APY']
-    
-    for balance in deposit_options_response.get('userBalances', []):
-        for option in balance.get('depositOptions', []):
-            asset_symbol = balance.get('asset', {}).get('symbol', 'N/A')
-            balance_usd = balance.get('asset', {}).get('balanceUsd')
-            balance_usd_formatted = f"${float(balance_usd):.2f}" if balance_usd else 'N/A'
-            
-            network_name = option.get('network', {}).get('name', 'N/A')
-            
-            vault_name = option.get('name', 'N/A')
-            vault_name_short = vault_name[:18] + '...' if len(vault_name) > 18 else vault_name
-            
-            protocol_name = option.get('protocol', {}).get('name', 'N/A')
-            
-            apy = option.get('apy', {}).get('total')
-            apy_formatted = f"{apy * 100:.2f}%" if apy else 'N/A'
-            
-            table_data.append([
-                asset_symbol,
-                balance_usd_formatted,
-                network_name,
-                vault_name_short,
-                protocol_name,
-                apy_formatted
-            ])
-    
-    return tabulate(table_data, headers=headers, tablefmt='grid')
-
-
-def format_positions(positions: Dict[str, Any]) -> str:
-    """Format user positions into a readable table."""
-    if not positions or not positions.get('data') or not isinstance(positions.get('data'), list):
-        return 'No positions available'
-    
-    table_data = []
-    headers = ['Network', 'Protocol', 'Vault Name', 'Asset', 'Balance USD', 'APY']
-    
-    has_positions = False
-    for position in positions.get('data', []):
-        has_positions = True
-        
-        network_name = position.get('network', {}).get('name', 'N/A')
-        protocol_name = position.get('protocol', {}).get('name', 'N/A')
-        
-        vault_name = position.get('name', 'Unknown Vault')
-        vault_name_short = vault_name[:16] + '...' if len(vault_name) > 16 else vault_name
-        
-        asset_symbol = position.get('asset', {}).get('symbol', 'N/A')
-        
-        balance_usd = position.get('asset', {}).get('balanceUsd')
-        balance_usd_formatted = f"${float(balance_usd):.2f}" if balance_usd else 'N/A'
-        
-        apy = position.get('apy', {}).get('total')
-        apy_formatted = f"{apy * 100:.2f}%" if apy else 'N/A'
-        
-        table_data.append([
-            network_name,
-            protocol_name,
-            vault_name_short,
-            asset_symbol,
-            balance_usd_formatted,
-            apy_formatted
-        ])
-    
-    return tabulate(table_data, headers=headers, tablefmt='grid') if has_positions else 'No active positions found'
-
-
-def format_user_balances(idle_assets: Dict[str, Any]) -> str:
-    """Format user balances into a readable table."""
-    if not idle_assets or not idle_assets.get('data') or not isinstance(idle_assets.get('data'), list):
-        return 'No idle assets available'
-    
-    table_data = []
-    headers = ['Asset', 'Balance', 'Balance USD', 'Network']
-    
-    has_balances = False
-    for asset in idle_assets.get('data', []):
-        has_balances = True
-        
-        symbol = asset.get('symbol', 'N/A')
-        
-        balance_native = asset.get('balanceNative')
-        balance_formatted = f"{float(balance_native):.6f} {symbol}" if balance_native else 'N/A'
-        
-        balance_usd = asset.get('balanceUsd')
-        balance_usd_formatted = f"${float(balance_usd):.2f}" if balance_usd else 'N/A'
-        
-        network_name = asset.get('network', {}).get('name', 'N/A')
-        
-        table_data.append([
-            symbol,
-            balance_formatted,
-            balance_usd_formatted,
-            network_name
-        ])
-    
-    return tabulate(table_data, headers=headers, tablefmt='grid') if has_balances else 'No idle assets found'
+            trunc = _truncate_data if key == 'data' else _truncate
+            yield [key, trunc(_s(value))]
+
+
+def _action_rows(actions: Any):
+    """Yield [key, value] rows expanding the actions array."""
+    if not isinstance(actions, list):
+        return
+    yield ['', '']  # Empty row for spacing
+    yield ['Total Actions', str(len(actions))]
+    yield ['', '']  # Empty row for spacing
+
+    for i, action in enumerate(actions):
+        if isinstance(action, dict):
+            # Action header
+            action_name = action.get('name', f'Action {i+1}')
+            yield [f'Action {i+1}', _truncate(action_name, 60)]
+
+            # Transaction details
+            for tx_key, tx_value in action.get('tx', {}).items():
+                trunc = _truncate_data if tx_key == 'data' else _truncate
+                yield [f'  {tx_key}', trunc(_s(tx_value))]
+
+            # Add spacing between actions
+            if i < len(actions) - 1:
+                yield ['', '']
+        else:
+            yield [f'Action {i+1}', _truncate(_s(action))]
+
+
+def format_transaction_blob(transaction: Dict[str, Any]) -> str:
+    """Format transaction data into a readable table."""
+    if not transaction or not isinstance(transaction, dict):
+        return 'No transaction data available'
+
+    # Assemble the flat properties and the expanded actions in one pass
+    table_data = [*_basic_rows(transaction), *_action_rows(transaction.get('actions'))]
+
+    return f"\n🎯 Generated Transaction Blob:\n{_tabulate()(table_data, headers=['Property', 'Value'], tablefmt='grid', maxcolwidths=[20, 60])}"
 
 
 def get_user_balances(client: VaultsSdk) -> Optional[Dict[str, Any]]:
@@ -194,6 +147,15 @@ def get_user_balances(client: VaultsSdk) -> Optional[Dict[str, Any]]:
         return None
 
 
+async def aget_user_balances(client: VaultsSdk) -> Optional[Dict[str, Any]]:
+    """Async variant of get_user_balances; fetches without printing."""
+    try:
+        return await asyncio.to_thread(client.get_idle_assets, USER_ADDRESS)
+    except Exception as error:
+        print(f'Error fetching user balances: {error}')
+        return None
+
+
 def get_best_deposit_options(client: VaultsSdk) -> Optional[Dict[str, Any]]:
     """Get best deposit options filtered for USDC/USDS."""
     try:
@@ -210,6 +172,19 @@ def get_best_deposit_options(client: VaultsSdk) -> Optional[Dict[str, Any]]:
         return None
 
 
+async def aget_best_deposit_options(client: VaultsSdk) -> Optional[Dict[str, Any]]:
+    """Async variant of get_best_deposit_options; fetches without printing."""
+    try:
+        return await asyncio.to_thread(
+            client.get_deposit_options,
+            USER_ADDRESS,
+            allowed_assets=['USDC', 'USDS']
+        )
+    except Exception as error:
+        print(f'Error fetching deposit options: {error}')
+        return None
+
+
 def generate_deposit_transaction_with_asset(
     client: VaultsSdk,
     vault_address: str,
@@ -241,6 +216,37 @@ def generate_deposit_transaction_with_asset(
         }
 
 
+async def agenerate_deposit_transactions(
+    client: VaultsSdk,
+    deposits: List[Dict[str, Any]],
+    max_concurrency: int = 8
+) -> List[Any]:
+    """Generate deposit transactions for many vaults concurrently.
+
+    Each entry in deposits is a kwargs dict for client.get_actions
+    (vault_address, amount, user_address, network, asset_address). The
+    calls are independent, so they run under asyncio.gather; a semaphore
+    caps in-flight requests at max_concurrency to stay inside API rate
+    limits while still overlapping the network round-trips. Failed
+    generations come back as the raised exception in their result slot.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _generate_one(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                client.get_actions,
+                action='deposit',
+                simulate=False,
+                **kwargs
+            )
+
+    return await asyncio.gather(
+        *(_generate_one(kwargs) for kwargs in deposits),
+        return_exceptions=True
+    )
+
+
 def get_user_positions(client: VaultsSdk) -> Optional[Dict[str, Any]]:
     """Get user's positions across all vaults."""
     try:
@@ -253,36 +259,82 @@ def get_user_positions(client: VaultsSdk) -> Optional[Dict[str, Any]]:
         return None
 
 
+async def aget_user_positions(client: VaultsSdk) -> Optional[Dict[str, Any]]:
+    """Async variant of get_user_positions; fetches without printing."""
+    try:
+        return await asyncio.to_thread(client.get_positions, USER_ADDRESS)
+    except Exception as error:
+        print(f'Error fetching user positions: {error}')
+        return None
+
+
+async def fetch_user_data(client: VaultsSdk):
+    """Fire the three independent SDK reads concurrently.
+
+    Balances, deposit options and positions don't depend on each other,
+    so running them concurrently cuts wall time from the sum of the three
+    round-trips to roughly the slowest one.
+    """
+    return await asyncio.gather(
+        aget_user_balances(client),
+        aget_best_deposit_options(client),
+        aget_user_positions(client),
+    )
+
+
+def _flush(lines: List[str]) -> None:
+    """Emit buffered lines in one write instead of one print per line.
+
+    A single write per section means one I/O lock acquisition and one
+    flush, which matters when stdout is a pipe (CI, docker logs).
+    """
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
 def run_example_implementation():
     """Run the complete example implementation."""
+    # Written immediately, not buffered: the async fetch helpers print
+    # their error lines directly, and those must land after the banner.
     print('🔷 ===== Vaults.fyi Python SDK Example Implementation ===== 🔷\n')
-    
+
     # Check for API key
     api_key = os.getenv('VAULTS_FYI_API_KEY')
     if not api_key:
         print('Please set VAULTS_FYI_API_KEY environment variable')
         return
-    
-    # Initialize the SDK
-    client = VaultsSdk(api_key=api_key)
-    
+
+    # Initialize the SDK; all helpers below share this client's session.
+    client = make_client(api_key)
+
+    # Fetch balances, deposit options and positions in parallel; only the
+    # deposit transaction below stays sequential.
+    idle_assets, top_options, positions = asyncio.run(fetch_user_data(client))
+
+    out = []
+
     # 0. Show user balances
-    print('💰 0. Checking user balances...')
-    get_user_balances(client)
-    
+    out.append('💰 0. Checking user balances...')
+    out.append('💰 User balances:')
+    out.append(format_user_balances(idle_assets))
+
     # 1. Get best deposit options
-    print('\n📈 1. Finding best deposit options...')
-    top_options = get_best_deposit_options(client)
-    
+    out.append('\n📈 1. Finding best deposit options...')
+    out.append('📊 Best deposit options (USDC/USDS only):')
+    out.append(format_deposit_options(top_options))
+
     # 2. Generate a deposit transaction for Sky Savings USDS on Base
-    print(f'\n💳 2. Generating deposit transaction into Sky Savings USDS on Base...')
-    
+    out.append('\n💳 2. Generating deposit transaction into Sky Savings USDS on Base...')
+
+    # Flush what we have so far; the transaction helper prints its own blob
+    _flush(out)
+    out = []
+
     # Hardcoded Sky Savings USDS vault details
     sky_vault_address = '0x1601843c5E9bC251A3272907010AFa41Fa18347E'
     usds_asset_address = '0x820c137fa70c8691f0e44dc420a5e53c168921dc'  # USDS token address on Base
     network = 'base'
     amount = '1000000000000000000'  # 1 USDS (18 decimals)
-    
+
     generate_deposit_transaction_with_asset(
         client,
         sky_vault_address,
@@ -291,12 +343,14 @@ def run_example_implementation():
         network,
         usds_asset_address
     )
-    
+
     # 3. View user positions
-    print('\n💼 3. Checking user positions...')
-    get_user_positions(client)
-    
-    print('\n🎉 === Example Implementation Complete === 🎉')
+    out.append('\n💼 3. Checking user positions...')
+    out.append('💼 User positions:')
+    out.append(format_positions(positions))
+
+    out.append('\n🎉 === Example Implementation Complete === 🎉')
+    _flush(out)
 
 
 if __name__ == '__main__':